@@ -41,7 +41,7 @@ def drug_recommendation_eicu_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import drug_recommendation_eicu_fn
         >>> eicu_sample = eicu_base.set_task(drug_recommendation_eicu_fn)
-        >>> eicu_sample.samples[0]
+        >>> eicu_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': [['2', '3', '4']]}]
     """
     samples = []
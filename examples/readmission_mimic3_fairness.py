@@ -25,7 +25,7 @@ test_dataloader = get_dataloader(test_dataset, batch_size=32, shuffle=False)
 # STEP 3: define model
 model = Transformer(
     dataset=sample_dataset,
-    # look up what are available for "feature_keys" and "label_keys" in dataset.samples[0]
+    # look up what are available for "feature_keys" and "label_keys" in dataset[0]
     feature_keys=["conditions", "procedures"],
     label_key="label",
     mode="binary",
@@ -17,7 +17,7 @@ print(dataset.stat())
 # step 2: set task
 sleep_staging_ds = dataset.set_task(sleep_staging_isruc_fn)
 sleep_staging_ds.stat()
-print(sleep_staging_ds.samples[0])
+print(sleep_staging_ds[0])
 
 # split dataset
 train_dataset, val_dataset, test_dataset = split_by_patient(
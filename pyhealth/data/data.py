@@ -1,8 +1,13 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Mapping, Optional, Union
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Timestamps are stored as Int64 seconds since this (naive, UTC) epoch
+_EPOCH = datetime(1970, 1, 1)
 
 
 @dataclass(frozen=True)
@@ -24,17 +29,20 @@ class Event:
         """Create an Event instance from a dictionary.
 
         Args:
-            d (Dict[str, any]): Dictionary containing event data.
+            d (Dict[str, any]): Dictionary containing event data, with one
+                "{event_type}/{attribute}" key per attribute. The timestamp
+                may be given as seconds since the UNIX epoch.
 
         Returns:
             Event: An instance of the Event class.
         """
         timestamp: datetime = d["timestamp"]
+        if isinstance(timestamp, int):
+            timestamp = _EPOCH + timedelta(seconds=timestamp)
         event_type: str = d["event_type"]
+        prefix = f"{event_type}/"
         attr_dict: Dict[str, any] = {
-            k.replace(event_type + "/", ""): v
-            for k, v in d.items()
-            if k.startswith(event_type)
+            k[len(prefix):]: v for k, v in d.items() if k.startswith(prefix)
         }
         return cls(event_type=event_type, timestamp=timestamp, attr_dict=attr_dict)
 
@@ -91,19 +99,46 @@ class Patient:
 
     Attributes:
         patient_id (str): Unique patient identifier.
-        data_source (pl.DataFrame): DataFrame containing all events.
+        data_source (pa.Table): Arrow table containing all events, sorted by
+            timestamp. Timestamps are stored as Int64 seconds since the UNIX
+            epoch.
     """
 
-    def __init__(self, patient_id: str, data_source: pl.DataFrame) -> None:
+    def __init__(
+        self,
+        patient_id: str,
+        data_source: Union[pa.Table, pl.DataFrame],
+    ) -> None:
         """
         Initialize a Patient instance.
 
         Args:
             patient_id (str): Unique patient identifier.
-            data_source (pl.DataFrame): DataFrame containing all events.
+            data_source (Union[pa.Table, pl.DataFrame]): All events. An Arrow
+                table is kept by reference and must already be sorted by
+                timestamp, while a DataFrame is sorted and converted.
         """
         self.patient_id = patient_id
-        self.data_source = data_source.sort("timestamp")
+        if isinstance(data_source, pl.DataFrame):
+            if data_source.schema["timestamp"].is_temporal():
+                data_source = data_source.with_columns(
+                    pl.col("timestamp").dt.epoch("s")
+                )
+            data_source = data_source.sort("timestamp").to_arrow()
+        self.data_source = data_source
+        self._events_df = None
+
+    def __getstate__(self) -> Dict[str, any]:
+        # Pickling an Arrow slice serializes the buffers of the whole parent
+        # table, so the events are copied into a DataFrame of their own
+        state = self.__dict__.copy()
+        state["data_source"] = pl.from_arrow(self.data_source)
+        state["_events_df"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, any]) -> None:
+        state["data_source"] = state["data_source"].to_arrow()
+        self.__dict__.update(state)
 
     def get_events(
         self,
@@ -125,13 +160,44 @@ class Patient:
             Union[pl.DataFrame, List[Event]]: Filtered events as a DataFrame 
             or a list of Event objects.
         """
-        df = self.data_source
+        if return_df:
+            if self._events_df is None:
+                # Converted once, as tasks may query the same patient repeatedly
+                self._events_df = pl.from_arrow(self.data_source).with_columns(
+                    pl.from_epoch("timestamp", time_unit="s")
+                )
+            df = self._events_df
+            if event_type:
+                df = df.filter(pl.col("event_type") == event_type)
+            if start:
+                df = df.filter(pl.col("timestamp") >= start)
+            if end:
+                df = df.filter(pl.col("timestamp") <= end)
+            return df
+
+        table = self.data_source
+        conditions = []
         if event_type:
-            df = df.filter(pl.col("event_type") == event_type)
+            conditions.append(pc.equal(table["event_type"], event_type))
         if start:
-            df = df.filter(pl.col("timestamp") >= start)
+            start = (start - _EPOCH).total_seconds()
+            conditions.append(pc.greater_equal(table["timestamp"], start))
         if end:
-            df = df.filter(pl.col("timestamp") <= end)
-        if return_df:
-            return df
-        return [Event.from_dict(d) for d in df.to_dicts()]
+            end = (end - _EPOCH).total_seconds()
+            conditions.append(pc.less_equal(table["timestamp"], end))
+        if event_type:
+            # Skip the attribute columns of other event types
+            prefix = f"{event_type}/"
+            table = table.select(
+                [
+                    col
+                    for col in table.column_names
+                    if "/" not in col or col.startswith(prefix)
+                ]
+            )
+        if conditions:
+            mask = conditions[0]
+            for condition in conditions[1:]:
+                mask = pc.and_(mask, condition)
+            table = table.filter(mask)
+        return [Event.from_dict(d) for d in table.to_pylist()]
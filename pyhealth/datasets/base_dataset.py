@@ -1,17 +1,129 @@
 import logging
+import multiprocessing
+import os
+import tempfile
 from abc import ABC
-from typing import Iterator, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import polars as pl
+import pyarrow as pa
 from tqdm import tqdm
 
 from ..data import Patient
 from ..tasks import BaseTask
 from .configs import load_yaml_config
 from .sample_dataset import SampleDataset
+from .utils import MODULE_CACHE_PATH, hash_str
 
 logger = logging.getLogger(__name__)
 
+
+def _parse_timestamp(df: pl.LazyFrame, timestamp_col: str) -> pl.Expr:
+    """Returns an expression parsing the timestamp column of a frame.
+
+    Args:
+        df (pl.LazyFrame): The frame containing the timestamp column.
+        timestamp_col (str): The name of the timestamp column.
+
+    Returns:
+        pl.Expr: The parsed timestamp as Int64 seconds since the UNIX
+        epoch, aliased to "__timestamp". No parsing is done if the column is
+        already typed (e.g., via dtype hints).
+    """
+    if df.collect_schema()[timestamp_col].is_temporal():
+        expr = pl.col(timestamp_col)
+    else:
+        # Clinical timestamps are highly repetitive, so memoize the parsing
+        expr = pl.col(timestamp_col).str.to_datetime(strict=False, cache=True)
+    return expr.cast(pl.Datetime).dt.epoch("s").alias("__timestamp")
+
+
+def _source_fingerprint(path: str) -> str:
+    """Returns a string identifying a source file and its current version.
+
+    Local files are identified by their absolute path, size and modification
+    time, so that the same relative path under another working directory, or
+    a file replaced by one with an older timestamp, is not mistaken for a
+    cached one. Remote files are identified by their URL.
+
+    Args:
+        path (str): Path or URL of the source file.
+
+    Returns:
+        str: The fingerprint of the file.
+    """
+    if not os.path.exists(path):
+        return path
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}+{stat.st_size}+{stat.st_mtime_ns}"
+
+
+def _remove_superseded(directory: str, prefix: str, keep: str) -> None:
+    """Removes the cache files of a directory sharing a prefix, except one.
+
+    Args:
+        directory (str): The cache directory.
+        prefix (str): The prefix of the file names identifying the cached data.
+        keep (str): The name of the current cache file.
+    """
+    for file_name in os.listdir(directory):
+        if file_name.startswith(prefix) and file_name != keep:
+            try:
+                os.remove(os.path.join(directory, file_name))
+            except OSError:
+                # Another process may have removed or still hold the file
+                pass
+
+
+def _is_sorted_by_patient(df: pl.DataFrame) -> bool:
+    """Checks whether events are grouped by patient and sorted by timestamp.
+
+    Args:
+        df (pl.DataFrame): The events to check.
+
+    Returns:
+        bool: Whether each patient's events are contiguous and in timestamp
+        order, with events without a timestamp first.
+    """
+    run = pl.col("patient_id").rle_id()
+    timestamp = pl.col("timestamp").fill_null(pl.col("timestamp").min() - 1)
+    return df.select(
+        (run.max() + 1 == pl.col("patient_id").n_unique()).fill_null(True)
+        & (timestamp.diff().over(run) >= 0).all()
+    ).item()
+
+
+def _append_samples(
+    columns: Dict[str, List], samples: List[Dict], required_keys: Set[str]
+) -> None:
+    """Appends samples to a column-wise sample store in place.
+
+    Samples may have differing keys. Values of keys missing from a sample are
+    set to None, so that all columns stay aligned.
+
+    Args:
+        columns (Dict[str, List]): Mapping from sample keys to value lists.
+        samples (List[Dict]): Samples to append.
+        required_keys (Set[str]): Keys every sample must have, i.e., the keys
+            of the input and output schemas.
+
+    Raises:
+        AssertionError: If a sample is missing one of the required keys.
+    """
+    for sample in samples:
+        missing_keys = required_keys - sample.keys()
+        assert (
+            not missing_keys
+        ), f"Sample is missing schema keys {sorted(missing_keys)}"
+        num_samples = len(next(iter(columns.values()))) if columns else 0
+        for k, v in sample.items():
+            columns.setdefault(k, [None] * num_samples).append(v)
+        for column in columns.values():
+            if len(column) == num_samples:
+                column.append(None)
+
+
 class BaseDataset(ABC):
     """Abstract base class for all PyHealth datasets.
 
@@ -20,7 +132,10 @@ class BaseDataset(ABC):
         tables (List[str]): List of table names to load.
         dataset_name (str): Name of the dataset.
         config (dict): Configuration loaded from a YAML file.
-        global_event_df (pl.LazyFrame): The global event data frame.
+        global_event_df (pl.LazyFrame): The global event data frame. Its
+            "timestamp" column holds Int64 seconds since the UNIX epoch.
+        cache_path (str): Path to the Arrow IPC file caching the collected
+            global event data frame.
     """
 
     def __init__(
@@ -46,21 +161,121 @@ class BaseDataset(ABC):
             f"Initializing {self.dataset_name} dataset from {self.root}"
         )
 
+        # Older polars versions need a global string cache to combine the
+        # categorical columns of different tables, newer ones always share one
+        if not hasattr(pl, "Categories"):
+            pl.enable_string_cache()
+
         self.global_event_df = self.load_data()
+        self.cache_path = self._cache_path()
 
         # Cached attributes
         self._collected_global_event_df = None
+        self._event_table = None
         self._unique_patient_ids = None
+        self._patient_index = None
+
+    def _cache_path(self) -> str:
+        """Returns the path of the file caching the global event data frame.
+
+        The file name starts with a prefix identifying the dataset, its root
+        and the loaded tables, followed by a hash of the table configurations,
+        the versions of the source files, the schema of the global event
+        data frame and the layout of the file. Cache files sharing the prefix
+        are superseded versions.
+
+        Returns:
+            str: The cache path.
+        """
+        root = os.path.abspath(self.root) if os.path.exists(self.root) else self.root
+        prefix = hash_str(f"{self.dataset_name}+{root}+{self.tables}")
+        source_paths = []
+        for table in self.tables:
+            table_cfg = self.config.tables[table]
+            source_paths.append(f"{self.root}/{table_cfg.file_path}")
+            source_paths.extend(
+                f"{self.root}/{join_cfg.file_path}" for join_cfg in table_cfg.join
+            )
+        sources = [_source_fingerprint(path) for path in source_paths]
+        configs = [self.config.tables[table].model_dump_json() for table in self.tables]
+        schema = self.global_event_df.collect_schema()
+        # Files written before the events were sorted by patient must not be
+        # sliced, so the layout is part of the version
+        layout = "sorted_by_patient"
+        version = hash_str(f"{configs}+{sources}+{schema}+{layout}")
+        return os.path.join(MODULE_CACHE_PATH, f"{prefix}_{version}.arrow")
+
+    def _cache_events(self) -> None:
+        """Writes the global event data frame to the cache file if missing.
+
+        The events are sorted by patient ID and timestamp once here, so that
+        each patient's events are a contiguous run of the file.
+        """
+        if os.path.exists(self.cache_path):
+            return
+        logger.info(f"Caching global event data frame: {self.cache_path}")
+        cache_dir, file_name = os.path.split(self.cache_path)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        os.close(fd)
+        try:
+            # The oldest compatibility level writes large strings, which
+            # pyarrow compute kernels accept unlike string views
+            self.global_event_df.sort(
+                "patient_id", "timestamp", maintain_order=True
+            ).sink_ipc(
+                tmp_path,
+                compression=None,
+                compat_level=pl.CompatLevel.oldest(),
+            )
+            os.replace(tmp_path, self.cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        prefix = file_name.split("_")[0] + "_"
+        _remove_superseded(cache_dir, prefix, file_name)
+
+    @property
+    def event_table(self) -> pa.Table:
+        """Returns the cached events as a memory-mapped Arrow table.
+
+        The table is backed by the page cache instead of process memory, so
+        processes loading the same dataset share a single copy. Events are
+        sorted by patient ID and timestamp.
+
+        Returns:
+            pa.Table: The memory-mapped events.
+        """
+        if self._event_table is None:
+            self._cache_events()
+            self._event_table = pa.ipc.open_file(
+                pa.memory_map(self.cache_path)
+            ).read_all()
+        return self._event_table
+
+    def _has_cached_events(self) -> bool:
+        """Checks whether the events can be read from the cache file.
+
+        Returns:
+            bool: Whether the cache file is loaded or exists.
+        """
+        return self._event_table is not None or os.path.exists(self.cache_path)
 
     @property
     def collected_global_event_df(self) -> pl.DataFrame:
         """Collects and returns the global event data frame.
 
+        The data frame is converted from the memory-mapped `event_table`.
+        Events are sorted by patient ID and timestamp. Unlike in
+        `global_event_df`, the "timestamp" column holds datetimes, so that
+        it can be compared to datetimes in `BaseTask.pre_filter`.
+
         Returns:
             pl.DataFrame: The collected global event data frame.
         """
         if self._collected_global_event_df is None:
-            self._collected_global_event_df = self.global_event_df.collect()
+            self._collected_global_event_df = pl.from_arrow(
+                self.event_table
+            ).with_columns(pl.from_epoch("timestamp", time_unit="s"))
         return self._collected_global_event_df
 
     def load_data(self) -> pl.LazyFrame:
@@ -72,6 +287,79 @@ class BaseDataset(ABC):
         frames = [self.load_table(table) for table in self.tables]
         return pl.concat(frames, how="diagonal")
 
+    def _file_dtypes(self, file_path: str) -> Dict[str, str]:
+        """Returns the dtype hints of all tables read from a file.
+
+        A file may be loaded both as a table and as a join of other tables, so
+        the hints are merged to convert and cache it only once.
+
+        Args:
+            file_path (str): Path of the file relative to the root.
+
+        Returns:
+            Dict[str, str]: Mapping from column names to Polars data type names.
+        """
+        dtypes = {}
+        for table_cfg in self.config.tables.values():
+            if table_cfg.file_path == file_path:
+                dtypes.update(table_cfg.dtypes)
+        return dtypes
+
+    def _ensure_parquet(
+        self, csv_path: str, dtypes: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Converts a CSV file to a typed Parquet file in the cache directory.
+
+        The conversion only happens once per version of the CSV file and of
+        the dtype hints. Superseded conversions of the same file are removed.
+
+        Args:
+            csv_path (str): Path to the CSV file.
+            dtypes (Optional[Dict[str, str]]): Mapping from (case-insensitive)
+                column names to Polars data type names. Other columns are kept
+                as strings.
+
+        Returns:
+            str: Path to the cached Parquet file.
+        """
+        dtypes = {k.lower(): v for k, v in (dtypes or {}).items()}
+        cache_dir = os.path.join(MODULE_CACHE_PATH, "parquet")
+        source = os.path.abspath(csv_path) if os.path.exists(csv_path) else csv_path
+        prefix = f"{hash_str(source)}_"
+        version = hash_str(f"{_source_fingerprint(csv_path)}+{sorted(dtypes.items())}")
+        file_name = f"{prefix}{version}.parquet"
+        parquet_path = os.path.join(cache_dir, file_name)
+        if os.path.exists(parquet_path):
+            return parquet_path
+
+        logger.info(f"Caching {csv_path} as Parquet: {parquet_path}")
+        os.makedirs(cache_dir, exist_ok=True)
+        df = pl.scan_csv(csv_path, infer_schema=False)
+        casts = []
+        for col in df.collect_schema().names():
+            if col.lower() not in dtypes:
+                continue
+            dtype = getattr(pl, dtypes[col.lower()])
+            if dtype.is_temporal():
+                casts.append(pl.col(col).str.strptime(dtype, strict=False))
+            else:
+                casts.append(pl.col(col).cast(dtype, strict=False))
+        # Write to a private temporary file first so that neither an
+        # interrupted conversion nor a concurrent one leaves a truncated cache
+        # file behind
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        os.close(fd)
+        try:
+            df.with_columns(casts).sink_parquet(
+                tmp_path, compression="zstd", statistics=True
+            )
+            os.replace(tmp_path, parquet_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _remove_superseded(cache_dir, prefix, file_name)
+        return parquet_path
+
     def load_table(self, table_name: str) -> pl.LazyFrame:
         """Loads a table and processes joins if specified.
 
@@ -96,10 +384,35 @@ class BaseDataset(ABC):
         #     raise FileNotFoundError(f"CSV not found: {csv_path}")
 
         logger.info(f"Scanning table: {table_name} from {csv_path}")
-        df = pl.scan_csv(csv_path, infer_schema=False)
+        df = pl.scan_parquet(
+            self._ensure_parquet(csv_path, self._file_dtypes(table_cfg.file_path))
+        )
         # TODO: this is an ad hoc fix for the MIMIC-III dataset
         df = df.with_columns([pl.col(col).alias(col.lower()) for col in df.collect_schema().names()])
 
+        patient_id_col = table_cfg.patient_id
+        timestamp_col = table_cfg.timestamp
+        attribute_cols = table_cfg.attributes
+
+        # Parse the timestamp on the frame providing it, before any join can
+        # duplicate its rows
+        timestamp_parsed = False
+        if timestamp_col and timestamp_col in df.collect_schema().names():
+            df = df.with_columns(_parse_timestamp(df, timestamp_col))
+            timestamp_parsed = True
+
+        # Only carry the referenced columns through the joins
+        referenced_cols = [
+            patient_id_col,
+            "__timestamp",
+            *attribute_cols,
+            *(join_cfg.on for join_cfg in table_cfg.join),
+        ]
+        available_cols = set(df.collect_schema().names())
+        df = df.select(
+            [col for col in dict.fromkeys(referenced_cols) if col in available_cols]
+        )
+
         # Handle joins
         for join_cfg in table_cfg.join:
             other_csv_path = f"{self.root}/{join_cfg.file_path}"
@@ -108,34 +421,38 @@ class BaseDataset(ABC):
             #         f"Join CSV not found: {other_csv_path}"
             #     )
 
-            join_df = pl.scan_csv(other_csv_path, infer_schema=False)
+            join_df = pl.scan_parquet(
+                self._ensure_parquet(
+                    other_csv_path, self._file_dtypes(join_cfg.file_path)
+                )
+            )
             join_df = join_df.with_columns([pl.col(col).alias(col.lower()) for col in join_df.collect_schema().names()])
             join_key = join_cfg.on
-            columns = join_cfg.columns
+            columns = [join_key] + join_cfg.columns
             how = join_cfg.how
 
-            df = df.join(
-                join_df.select([join_key] + columns), on=join_key, how=how
-            )
+            if not timestamp_parsed and timestamp_col in join_cfg.columns:
+                join_df = join_df.with_columns(
+                    _parse_timestamp(join_df, timestamp_col)
+                )
+                columns.append("__timestamp")
+                timestamp_parsed = True
 
-        patient_id_col = table_cfg.patient_id
-        timestamp_col = table_cfg.timestamp
-        attribute_cols = table_cfg.attributes
+            df = df.join(join_df.select(columns), on=join_key, how=how)
 
         # Timestamp expression
         timestamp_expr = (
-            pl.col(timestamp_col).str.strptime(
-                pl.Datetime, strict=False
-            )
+            pl.col("__timestamp")
             if timestamp_col
-            else pl.lit(None, dtype=pl.Datetime)
+            else pl.lit(None, dtype=pl.Int64)
         )
 
-        # Prepare base event columns
+        # Prepare base event columns. IDs and event types are categorical so
+        # that grouping and filtering compare integers instead of strings.
         base_columns = [
-            pl.col(patient_id_col).cast(pl.Utf8).alias("patient_id"),
-            pl.lit(table_name).cast(pl.Utf8).alias("event_type"),
-            timestamp_expr.cast(pl.Datetime).alias("timestamp"),
+            pl.col(patient_id_col).cast(pl.Utf8).cast(pl.Categorical).alias("patient_id"),
+            pl.lit(table_name).cast(pl.Categorical).alias("event_type"),
+            timestamp_expr.alias("timestamp"),
         ]
 
         # Flatten attribute columns with event_type prefix
@@ -156,12 +473,18 @@ class BaseDataset(ABC):
             List[str]: List of unique patient IDs.
         """
         if self._unique_patient_ids is None:
-            self._unique_patient_ids = (
-                self.collected_global_event_df.select("patient_id")
-                .unique()
-                .to_series()
-                .to_list()
-            )
+            if self._has_cached_events():
+                # Read the memory-mapped IDs instead of rescanning the sources
+                patient_ids = pl.from_arrow(self.event_table["patient_id"]).unique()
+            else:
+                # Only a set of IDs is held instead of collecting all events
+                patient_ids = (
+                    self.global_event_df.select("patient_id")
+                    .unique()
+                    .collect(engine="streaming")
+                    .to_series()
+                )
+            self._unique_patient_ids = patient_ids.to_list()
         return self._unique_patient_ids
 
     def get_patient(self, patient_id: str) -> Patient:
@@ -176,33 +499,79 @@ class BaseDataset(ABC):
         Raises:
             AssertionError: If the patient ID is not found in the dataset.
         """
+        if self._patient_index is None:
+            self._patient_index = self._build_patient_index()
         assert (
-            patient_id in self.unique_patient_ids
+            patient_id in self._patient_index
         ), f"Patient {patient_id} not found in dataset"
-        df = self.collected_global_event_df.filter(
-            pl.col("patient_id") == patient_id
+        return Patient(
+            patient_id=patient_id, data_source=self._patient_index[patient_id]
         )
-        return Patient(patient_id=patient_id, data_source=df)
 
-    def iter_patients(self, df: Optional[pl.LazyFrame] = None) -> Iterator[Patient]:
+    def _build_patient_index(self) -> Dict[str, pa.Table]:
+        """Builds a mapping from patient ID to the patient's events.
+
+        Returns:
+            Dict[str, pa.Table]: Mapping from patient ID to its events.
+        """
+        return dict(self._slice_patients(self.event_table))
+
+    @staticmethod
+    def _slice_patients(table: pa.Table) -> Iterator[Tuple[str, pa.Table]]:
+        """Splits events sorted by patient ID into one Arrow table per patient.
+
+        Each patient is a zero-copy slice of the given table.
+
+        Args:
+            table (pa.Table): The events, sorted by patient ID and timestamp.
+
+        Yields:
+            Tuple[str, pa.Table]: A patient ID and the patient's events.
+        """
+        runs = pl.from_arrow(table["patient_id"]).rle().struct.unnest()
+        offset = 0
+        for length, patient_id in runs.iter_rows():
+            yield patient_id, table.slice(offset, length)
+            offset += length
+
+    def iter_patients(self, df: Optional[pl.DataFrame] = None) -> Iterator[Patient]:
         """Yields Patient objects for each unique patient in the dataset.
 
+        Args:
+            df (Optional[pl.DataFrame]): The events to group by patient, e.g. a
+                filtered `collected_global_event_df`. Defaults to all events,
+                which are sliced from the memory-mapped `event_table`.
+
         Yields:
             Iterator[Patient]: An iterator over Patient objects.
         """
         if df is None:
-            df = self.collected_global_event_df
-        grouped = df.group_by("patient_id")
-
-        for patient_id, patient_df in grouped:
-            yield Patient(patient_id=patient_id, data_source=patient_df)
+            table = self.event_table
+        else:
+            if df.schema["timestamp"].is_temporal():
+                df = df.with_columns(pl.col("timestamp").dt.epoch("s"))
+            # Filtering the collected events keeps them sorted, other frames
+            # are sorted here
+            if not _is_sorted_by_patient(df):
+                df = df.sort("patient_id", "timestamp", maintain_order=True)
+            table = df.to_arrow()
+        for patient_id, patient_events in self._slice_patients(table):
+            yield Patient(patient_id=patient_id, data_source=patient_events)
 
     def stats(self) -> None:
         """Prints statistics about the dataset."""
-        df = self.collected_global_event_df
+        if self._has_cached_events():
+            # Count the memory-mapped events instead of rescanning the sources
+            num_patients = pl.from_arrow(self.event_table["patient_id"]).n_unique()
+            num_events = self.event_table.num_rows
+        else:
+            # Aggregate in the streaming engine instead of collecting all events
+            num_patients, num_events = self.global_event_df.select(
+                pl.col("patient_id").n_unique(), pl.len()
+            ).collect(engine="streaming").row(0)
         print(f"Dataset: {self.dataset_name}")
-        print(f"Number of patients: {df['patient_id'].n_unique()}")
-        print(f"Number of events: {df.height}")
+        print(f"Number of patients: {num_patients}")
+        print(f"Number of events: {num_events}")
 
     @property
     def default_task(self) -> Optional[BaseTask]:
@@ -213,11 +582,21 @@ class BaseDataset(ABC):
         """
         return None
 
-    def set_task(self, task: Optional[BaseTask] = None) -> SampleDataset:
+    def set_task(
+        self, task: Optional[BaseTask] = None, num_workers: int = 1
+    ) -> SampleDataset:
         """Processes the base dataset to generate the task-specific sample dataset.
 
+        If the task provides a `vectorized_expr` query, the samples are
+        generated by that query alone, without `pre_filter`. Otherwise the
+        task is called on each patient remaining after `pre_filter`.
+
         Args:
             task (Optional[BaseTask]): The task to set. Uses default task if None.
+            num_workers (int): Number of worker processes used to generate
+                samples. Patients are processed serially if set to 0 or 1,
+                otherwise they are dispatched to a process pool, in which case
+                the task must be picklable. Defaults to 1.
 
         Returns:
             SampleDataset: The generated sample dataset.
@@ -231,18 +610,73 @@ class BaseDataset(ABC):
 
         logger.info(f"Setting task for {self.dataset_name} base dataset...")
 
-        filtered_global_event_df = task.pre_filter(self.collected_global_event_df)
+        samples_lf = task.vectorized_expr(self.global_event_df)
+        if samples_lf is not None:
+            # The task is expressed as a single query over all events, so
+            # samples are generated natively without iterating patients
+            logger.info(f"Generating samples for {task.task_name} (vectorized)")
+            columns = samples_lf.collect(engine="streaming").to_dict(as_series=False)
+        else:
+            columns = self._generate_samples(task, num_workers)
 
-        samples = []
-        for patient in tqdm(
-            self.iter_patients(filtered_global_event_df), desc=f"Generating samples for {task.task_name}"
-        ):
-            samples.extend(task(patient))
         sample_dataset = SampleDataset(
-            samples,
+            columns,
             input_schema=task.input_schema,
             output_schema=task.output_schema,
             dataset_name=self.dataset_name,
             task_name=task,
         )
         return sample_dataset
+
+    def _generate_samples(self, task: BaseTask, num_workers: int) -> Dict[str, List]:
+        """Generates samples by calling the task on each patient.
+
+        Args:
+            task (BaseTask): The task generating samples from a patient.
+            num_workers (int): Number of worker processes. Patients are
+                processed serially if set to 0 or 1.
+
+        Returns:
+            Dict[str, List]: Mapping from sample keys to the list of values of
+            all samples.
+        """
+        if type(task).pre_filter is BaseTask.pre_filter:
+            # Nothing is filtered, so patients are sliced from the memory-mapped
+            # events without collecting them
+            filtered_global_event_df = None
+        else:
+            filtered_global_event_df = task.pre_filter(self.collected_global_event_df)
+        required_keys = set(task.input_schema) | set(task.output_schema)
+
+        # Accumulate samples column-wise instead of as a list of dicts
+        columns = {}
+        if num_workers <= 1:
+            for patient in tqdm(
+                self.iter_patients(filtered_global_event_df),
+                desc=f"Generating samples for {task.task_name}",
+            ):
+                _append_samples(columns, task(patient), required_keys)
+        else:
+            # task(patient) only depends on a single patient, so patients can
+            # be processed in parallel across processes to bypass the GIL.
+            # Workers are spawned since forking after polars has started its
+            # thread pool can deadlock.
+            if filtered_global_event_df is None:
+                patient_ids = pl.from_arrow(self.event_table["patient_id"])
+            else:
+                patient_ids = filtered_global_event_df["patient_id"]
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                for patient_samples in tqdm(
+                    executor.map(
+                        task,
+                        self.iter_patients(filtered_global_event_df),
+                        chunksize=64,
+                    ),
+                    total=patient_ids.n_unique(),
+                    desc=f"Generating samples for {task.task_name}",
+                ):
+                    _append_samples(columns, patient_samples, required_keys)
+        return columns
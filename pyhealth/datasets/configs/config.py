@@ -5,6 +5,8 @@ configurations in YAML format. It uses Pydantic models to ensure type safety
 and validation of configuration files.
 """
 
+import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import yaml
@@ -47,12 +49,18 @@ class TableConfig(BaseModel):
         attributes (List[str]): List of column names to include as attributes.
         join (Optional[List[JoinConfig]]): List of join configurations for this
             table.
+        dtypes (Dict[str, str]): Mapping from column names to Polars data type
+            names (e.g., 'Datetime', 'Int64', 'Categorical'). These columns are
+            cast once when the table is cached as Parquet, and also apply
+            wherever the same file is joined. Columns not listed are kept as
+            strings.
     """
     file_path: str
     patient_id: str
     timestamp: Optional[str]
     attributes: List[str]
     join: List[JoinConfig] = Field(default_factory=list)
+    dtypes: Dict[str, str] = Field(default_factory=dict)
 
 
 class DatasetConfig(BaseModel):
@@ -93,6 +101,24 @@ def load_yaml_config(file_path: str) -> DatasetConfig:
         pydantic.ValidationError: If the configuration does not match the
             expected schema.
     """
+    file_path = os.path.abspath(file_path)
+    config = _load_yaml_config(file_path, os.path.getmtime(file_path))
+    # Each caller gets its own copy so the cached config is never mutated
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_config(file_path: str, mtime: float) -> DatasetConfig:
+    """Parses a configuration file, memoized on its path and modification time.
+
+    Args:
+        file_path (str): Absolute path to the YAML configuration file.
+        mtime (float): Modification time of the file, so that edits to the
+            file invalidate the cached configuration.
+
+    Returns:
+        DatasetConfig: Validated dataset configuration object.
+    """
     with open(file_path, 'r') as f:
         raw_config = yaml.safe_load(f)
     return DatasetConfig.model_validate(raw_config)
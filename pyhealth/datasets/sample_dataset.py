@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from torch.utils.data import Dataset
 
@@ -8,8 +8,12 @@ from ..processors import get_processor
 class SampleDataset(Dataset):
     """Sample dataset class for handling and processing data samples.
 
+    Samples are stored column-wise, i.e., as one list per sample key, which
+    avoids keeping a dictionary per sample.
+
     Attributes:
-        samples (List[Dict]): List of data samples.
+        columns (Dict[str, List]): Mapping from sample keys to the list of
+            values of all samples.
         input_schema (Dict[str, str]): Schema for input data.
         output_schema (Dict[str, str]): Schema for output data.
         dataset_name (Optional[str]): Name of the dataset.
@@ -18,7 +22,7 @@ class SampleDataset(Dataset):
 
     def __init__(
         self,
-        samples: List[Dict],
+        samples: Union[List[Dict], Dict[str, List]],
         input_schema: Dict[str, str],
         output_schema: Dict[str, str],
         dataset_name: Optional[str] = None,
@@ -27,7 +31,10 @@ class SampleDataset(Dataset):
         """Initializes the SampleDataset with samples and schemas.
 
         Args:
-            samples (List[Dict]): List of data samples.
+            samples (Union[List[Dict], Dict[str, List]]): List of data samples,
+                or mapping from sample keys to the list of values of all
+                samples. Samples may have differing keys, in which case the
+                values of keys missing from a sample are None.
             input_schema (Dict[str, str]): Schema for input data.
             output_schema (Dict[str, str]): Schema for output data.
             dataset_name (Optional[str], optional): Name of the dataset. Defaults to None.
@@ -37,43 +44,77 @@ class SampleDataset(Dataset):
             dataset_name = ""
         if task_name is None:
             task_name = ""
-        self.samples = samples
         self.input_schema = input_schema
         self.output_schema = output_schema
         self.input_processors = {}
         self.output_processors = {}
         self.dataset_name = dataset_name
         self.task_name = task_name
+        if isinstance(samples, dict):
+            # Copied, as build() replaces the values with processed ones
+            self.columns = {k: list(v) for k, v in samples.items()}
+        else:
+            self.validate_samples(samples)
+            keys = dict.fromkeys(k for s in samples for k in s)
+            self.columns = {k: [s.get(k) for s in samples] for k in keys}
         self.validate()
         self.build()
 
-    def validate(self) -> None:
-        """Validates that the samples match the input and output schemas."""
+    def validate_samples(self, samples: List[Dict]) -> None:
+        """Validates that a list of samples matches the input and output schemas.
+
+        Args:
+            samples (List[Dict]): List of data samples.
+        """
         input_keys = set(self.input_schema.keys())
         output_keys = set(self.output_schema.keys())
-        for s in self.samples:
+        for s in samples:
             assert input_keys.issubset(s.keys()), \
                 "Input schema does not match samples."
             assert output_keys.issubset(s.keys()), \
                 "Output schema does not match samples."
         return
 
+    def validate(self) -> None:
+        """Validates that the sample columns match the input and output schemas."""
+        if not self.columns:
+            return
+        input_keys = set(self.input_schema.keys())
+        output_keys = set(self.output_schema.keys())
+        assert input_keys.issubset(self.columns.keys()), \
+            "Input schema does not match samples."
+        assert output_keys.issubset(self.columns.keys()), \
+            "Output schema does not match samples."
+        assert len({len(v) for v in self.columns.values()}) == 1, \
+            "Sample columns do not have the same length."
+        return
+
     def build(self) -> None:
         """Builds the processors for input and output data based on schemas."""
-        for k, v in self.input_schema.items():
-            self.input_processors[k] = get_processor(v)()
-            self.input_processors[k].fit(self.samples, k)
-        for k, v in self.output_schema.items():
-            self.output_processors[k] = get_processor(v)()
-            self.output_processors[k].fit(self.samples, k)
-        for sample in self.samples:
-            for k, v in sample.items():
-                if k in self.input_processors:
-                    sample[k] = self.input_processors[k].process(v)
-                elif k in self.output_processors:
-                    sample[k] = self.output_processors[k].process(v)
+        for schema, processors in [
+            (self.input_schema, self.input_processors),
+            (self.output_schema, self.output_processors),
+        ]:
+            for k, v in schema.items():
+                values = self.columns.get(k, [])
+                processors[k] = get_processor(v)()
+                processors[k].fit([{k: value} for value in values], k)
+                self.columns[k] = [processors[k].process(value) for value in values]
         return
 
+    @property
+    def samples(self) -> List[Dict]:
+        """Returns the samples as a list of dictionaries.
+
+        The dictionaries are rebuilt from the columns on every access, which
+        takes O(N) time, and modifying them does not change the dataset. Use
+        `dataset[i]` to retrieve a single sample.
+
+        Returns:
+            List[Dict]: List of data samples.
+        """
+        return [self[i] for i in range(len(self))]
+
     def __getitem__(self, index: int) -> Dict:
         """Returns a sample by index.
 
@@ -85,7 +126,7 @@ class SampleDataset(Dataset):
             attributes as key. Conversion to index/tensor will be done
             in the model.
         """
-        return self.samples[index]
+        return {k: column[index] for k, column in self.columns.items()}
 
     def __str__(self) -> str:
         """Returns a string representation of the dataset.
@@ -101,4 +142,6 @@ class SampleDataset(Dataset):
         Returns:
             int: The number of samples.
         """
-        return len(self.samples)
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
@@ -185,22 +185,47 @@ def collate_fn_dict_with_padding(batch: List[dict]) -> dict:
     return collated
 
 
-def get_dataloader(dataset: torch.utils.data.Dataset, batch_size: int, shuffle: bool = False) -> DataLoader:
+def get_dataloader(
+    dataset: torch.utils.data.Dataset,
+    batch_size: int,
+    shuffle: bool = False,
+    num_workers: int = 0,
+    pin_memory: bool = False,
+    prefetch_factor: int = 2,
+    persistent_workers: bool = True,
+) -> DataLoader:
     """Creates a DataLoader for a given dataset.
 
     Args:
         dataset: The dataset to load data from.
         batch_size: The number of samples per batch.
         shuffle: Whether to shuffle the data at every epoch.
+        num_workers: The number of worker processes collating batches in the
+            background. Default is 0, which collates in the main process.
+        pin_memory: Whether to copy batches into pinned memory so that host to
+            device copies can be asynchronous. Default is False.
+        prefetch_factor: The number of batches loaded in advance by each
+            worker. Only used if num_workers > 0. Default is 2.
+        persistent_workers: Whether to keep workers alive across epochs. Only
+            used if num_workers > 0. Default is True.
 
     Returns:
         A DataLoader instance for the dataset.
     """
+    worker_kwargs = {}
+    if num_workers > 0:
+        worker_kwargs = {
+            "persistent_workers": persistent_workers,
+            "prefetch_factor": prefetch_factor,
+        }
     dataloader = DataLoader(
         dataset,
         batch_size=batch_size,
         shuffle=shuffle,
         collate_fn=collate_fn_dict_with_padding,
+        num_workers=num_workers,
+        pin_memory=pin_memory,
+        **worker_kwargs,
     )
 
     return dataloader
@@ -54,7 +54,7 @@ class EmbeddingModel(BaseModel):
         embedded = {}
         for field_name, tensor in inputs.items():
             if field_name in self.embedding_layers:
-                tensor = tensor.to(self.device)
+                tensor = tensor.to(self.device, non_blocking=True)
                 embedded[field_name] = self.embedding_layers[field_name](tensor)
             else:
                 embedded[field_name] = tensor  # passthrough for continuous features
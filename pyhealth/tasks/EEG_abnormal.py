@@ -29,7 +29,7 @@ def EEG_isAbnormal_fn(record):
         ...     )
         >>> from pyhealth.tasks import EEG_isabnormal_fn
         >>> EEG_abnormal_ds = isabnormal.set_task(EEG_isAbnormal_fn)
-        >>> EEG_abnormal_ds.samples[0]
+        >>> EEG_abnormal_ds[0]
         {
             'patient_id': 'aaaaamye',
             'visit_id': 's001',
@@ -165,7 +165,7 @@ if __name__ == "__main__":
         refresh_cache=True,
     )
     EEG_abnormal_ds = dataset.set_task(EEG_isAbnormal_fn)
-    print(EEG_abnormal_ds.samples[0])
+    print(EEG_abnormal_ds[0])
     print(EEG_abnormal_ds.input_info)
     
     
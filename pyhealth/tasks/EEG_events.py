@@ -28,7 +28,7 @@ def EEG_events_fn(record):
         ...     )
         >>> from pyhealth.tasks import EEG_events_fn
         >>> EEG_events_ds = EEGevents.set_task(EEG_events_fn)
-        >>> EEG_events_ds.samples[0]
+        >>> EEG_events_ds[0]
         {
             'patient_id': '0_00002265',
             'visit_id': '00000001',
@@ -201,7 +201,7 @@ if __name__ == "__main__":
         refresh_cache=True,
     )
     EEG_events_ds = dataset.set_task(EEG_events_fn)
-    print(EEG_events_ds.samples[0])
+    print(EEG_events_ds[0])
     print(EEG_events_ds.input_info)
     
     
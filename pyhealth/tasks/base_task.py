@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import polars as pl
 
@@ -10,8 +10,44 @@ class BaseTask(ABC):
     output_schema: Dict[str, str]
 
     def pre_filter(self, df: pl.LazyFrame) -> pl.LazyFrame:
+        """Optionally filters the events before the task is called on each patient.
+
+        Args:
+            df (pl.LazyFrame): The collected global event data frame, with one
+                row per event. It has a "patient_id", an "event_type" and a
+                "timestamp" column, the latter as datetimes, and one
+                "{event_type}/{attribute}" column per attribute of each
+                loaded table.
+
+        Returns:
+            pl.LazyFrame: The events of the patients to call the task on.
+        """
         return df
 
+    def vectorized_expr(self, df: pl.LazyFrame) -> Optional[pl.LazyFrame]:
+        """Optionally generates all samples with a single Polars query.
+
+        Tasks expressible as group-wise Polars expressions can override this
+        to return one row per sample, with columns matching the input and
+        output schemas. The query then runs once over the global event data
+        frame instead of calling the task on each patient. `pre_filter` is
+        not applied to the events passed here, so any filtering has to be
+        part of the query.
+
+        Args:
+            df (pl.LazyFrame): The global event data frame, with one row per
+                event. It has a "patient_id", an "event_type" and a
+                "timestamp" column, the latter as Int64 seconds since the
+                UNIX epoch, and one "{event_type}/{attribute}" column per
+                attribute of each loaded table, which is null for events of
+                other types.
+
+        Returns:
+            Optional[pl.LazyFrame]: The samples, or None to fall back to
+            calling the task on each patient.
+        """
+        return None
+
     @abstractmethod
     def __call__(self, patient) -> List[Dict]:
         raise NotImplementedError
\ No newline at end of file
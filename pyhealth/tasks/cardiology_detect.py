@@ -33,7 +33,7 @@ def cardiology_isAR_fn(record, epoch_sec=10, shift=5):
         ...     )
         >>> from pyhealth.tasks import cardiology_isAR_fn
         >>> cardiology_ds = isAR.set_task(cardiology_isAR_fn)
-        >>> cardiology_ds.samples[0]
+        >>> cardiology_ds[0]
         {
             'patient_id': '0_0',
             'visit_id': 'A0033',
@@ -134,7 +134,7 @@ def cardiology_isBBBFB_fn(record, epoch_sec=10, shift=5):
         ...     )
         >>> from pyhealth.tasks import cardiology_isBBBFB_fn
         >>> cardiology_ds = isBBBFB.set_task(cardiology_isBBBFB_fn)
-        >>> cardiology_ds.samples[0]
+        >>> cardiology_ds[0]
         {
             'patient_id': '0_0',
             'visit_id': 'A0033',
@@ -230,7 +230,7 @@ def cardiology_isAD_fn(record, epoch_sec=10, shift=5):
         ...     )
         >>> from pyhealth.tasks import cardiology_isAD_fn
         >>> cardiology_ds = isAD.set_task(cardiology_isAD_fn)
-        >>> cardiology_ds.samples[0]
+        >>> cardiology_ds[0]
         {
             'patient_id': '0_0',
             'visit_id': 'A0033',
@@ -323,7 +323,7 @@ def cardiology_isCD_fn(record, epoch_sec=10, shift=5):
         ...     )
         >>> from pyhealth.tasks import cardiology_isCD_fn
         >>> cardiology_ds = isCD.set_task(cardiology_isCD_fn)
-        >>> cardiology_ds.samples[0]
+        >>> cardiology_ds[0]
         {
             'patient_id': '0_0',
             'visit_id': 'A0033',
@@ -418,7 +418,7 @@ def cardiology_isWA_fn(record, epoch_sec=10, shift=5):
         ...     )
         >>> from pyhealth.tasks import cardiology_isWA_fn
         >>> cardiology_ds = isWA.set_task(cardiology_isWA_fn)
-        >>> cardiology_ds.samples[0]
+        >>> cardiology_ds[0]
         {
             'patient_id': '0_0',
             'visit_id': 'A0033',
@@ -506,7 +506,7 @@ if __name__ == "__main__":
         refresh_cache=True,
     )
     sleep_staging_ds = dataset.set_task(cardiology_isAR_fn)
-    print(sleep_staging_ds.samples[0])
+    print(sleep_staging_ds[0])
     # print(sleep_staging_ds.patient_to_index)
     # print(sleep_staging_ds.record_to_index)
     print(sleep_staging_ds.input_info)
@@ -31,7 +31,7 @@ def drug_recommendation_mimic3_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import drug_recommendation_mimic3_fn
         >>> mimic3_sample = mimic3_base.set_task(drug_recommendation_mimic3_fn)
-        >>> mimic3_sample.samples[0]
+        >>> mimic3_sample[0]
         {
             'visit_id': '174162',
             'patient_id': '107',
@@ -119,7 +119,7 @@ def drug_recommendation_mimic4_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import drug_recommendation_mimic4_fn
         >>> mimic4_sample = mimic4_base.set_task(drug_recommendation_mimic4_fn)
-        >>> mimic4_sample.samples[0]
+        >>> mimic4_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': [['2', '3', '4']]}]
     """
     samples = []
@@ -193,7 +193,7 @@ def drug_recommendation_eicu_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import drug_recommendation_eicu_fn
         >>> eicu_sample = eicu_base.set_task(drug_recommendation_eicu_fn)
-        >>> eicu_sample.samples[0]
+        >>> eicu_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': [['2', '3', '4']]}]
     """
     samples = []
@@ -260,7 +260,7 @@ def drug_recommendation_omop_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import drug_recommendation_omop_fn
         >>> omop_sample = omop_base.set_task(drug_recommendation_eicu_fn)
-        >>> omop_sample.samples[0]
+        >>> omop_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51'], ['98', '663', '58', '51']], 'procedures': [['1'], ['2', '3']], 'label': [['2', '3', '4'], ['0', '1', '4', '5']]}]
     """
 
@@ -318,7 +318,7 @@ if __name__ == "__main__":
     # sample_dataset = base_dataset.set_task(task_fn=drug_recommendation_mimic3_fn)
     # sample_dataset.stat()
     # print(sample_dataset.available_keys)
-    # print(sample_dataset.samples[0])
+    # print(sample_dataset[0])
 
     from pyhealth.datasets import MIMIC4Dataset
 
@@ -332,7 +332,7 @@ if __name__ == "__main__":
     sample_dataset = base_dataset.set_task(task_fn=drug_recommendation_mimic4_fn)
     sample_dataset.stat()
     print(sample_dataset.available_keys)
-    print(sample_dataset.samples[0])
+    print(sample_dataset[0])
 
     # from pyhealth.datasets import eICUDataset
 
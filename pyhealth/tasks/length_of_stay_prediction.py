@@ -53,7 +53,7 @@ def length_of_stay_prediction_mimic3_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import length_of_stay_prediction_mimic3_fn
         >>> mimic3_sample = mimic3_base.set_task(length_of_stay_prediction_mimic3_fn)
-        >>> mimic3_sample.samples[0]
+        >>> mimic3_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 4}]
     """
     samples = []
@@ -110,7 +110,7 @@ def length_of_stay_prediction_mimic4_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import length_of_stay_prediction_mimic4_fn
         >>> mimic4_sample = mimic4_base.set_task(length_of_stay_prediction_mimic4_fn)
-        >>> mimic4_sample.samples[0]
+        >>> mimic4_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 2}]
     """
     samples = []
@@ -168,7 +168,7 @@ def length_of_stay_prediction_eicu_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import length_of_stay_prediction_eicu_fn
         >>> eicu_sample = eicu_base.set_task(length_of_stay_prediction_eicu_fn)
-        >>> eicu_sample.samples[0]
+        >>> eicu_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 5}]
     """
     samples = []
@@ -225,7 +225,7 @@ def length_of_stay_prediction_omop_fn(patient: Patient):
         ... )
         >>> from pyhealth.tasks import length_of_stay_prediction_omop_fn
         >>> omop_sample = omop_base.set_task(length_of_stay_prediction_eicu_fn)
-        >>> omop_sample.samples[0]
+        >>> omop_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 7}]
     """
     samples = []
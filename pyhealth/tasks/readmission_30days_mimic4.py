@@ -37,7 +37,7 @@ class Readmission30DaysMIMIC4(BaseTask):
             ... )
             >>> from pyhealth.tasks import readmission_prediction_mimic4_fn
             >>> mimic4_sample = mimic4_base.set_task(readmission_prediction_mimic4_fn)
-            >>> mimic4_sample.samples[0]
+            >>> mimic4_sample[0]
             [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 0}]
         """
         samples = []
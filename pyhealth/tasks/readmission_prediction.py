@@ -29,7 +29,7 @@ def readmission_prediction_mimic3_fn(patient: Patient, time_window=15):
         ... )
         >>> from pyhealth.tasks import readmission_prediction_mimic3_fn
         >>> mimic3_sample = mimic3_base.set_task(readmission_prediction_mimic3_fn)
-        >>> mimic3_sample.samples[0]
+        >>> mimic3_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 1}]
     """
     samples = []
@@ -91,7 +91,7 @@ def readmission_prediction_mimic4_fn(patient: Patient, time_window=15):
         ... )
         >>> from pyhealth.tasks import readmission_prediction_mimic4_fn
         >>> mimic4_sample = mimic4_base.set_task(readmission_prediction_mimic4_fn)
-        >>> mimic4_sample.samples[0]
+        >>> mimic4_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '19', '122', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 0}]
     """
     samples = []
@@ -159,7 +159,7 @@ def readmission_prediction_eicu_fn(patient: Patient, time_window=5):
         ... )
         >>> from pyhealth.tasks import readmission_prediction_eicu_fn
         >>> eicu_sample = eicu_base.set_task(readmission_prediction_eicu_fn)
-        >>> eicu_sample.samples[0]
+        >>> eicu_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 1}]
     """
     samples = []
@@ -224,7 +224,7 @@ def readmission_prediction_eicu_fn2(patient: Patient, time_window=5):
         ... )
         >>> from pyhealth.tasks import readmission_prediction_eicu_fn2
         >>> eicu_sample = eicu_base.set_task(readmission_prediction_eicu_fn2)
-        >>> eicu_sample.samples[0]
+        >>> eicu_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 1}]
     """
     samples = []
@@ -291,7 +291,7 @@ def readmission_prediction_omop_fn(patient: Patient, time_window=15):
         ... )
         >>> from pyhealth.tasks import readmission_prediction_omop_fn
         >>> omop_sample = omop_base.set_task(readmission_prediction_eicu_fn)
-        >>> omop_sample.samples[0]
+        >>> omop_sample[0]
         [{'visit_id': '130744', 'patient_id': '103', 'conditions': [['42', '109', '98', '663', '58', '51']], 'procedures': [['1']], 'label': 1}]
     """
     samples = []
@@ -34,7 +34,7 @@ def sleep_staging_isruc_fn(record, epoch_seconds=10, label_id=1):
         ...     )
         >>> from pyhealth.tasks import sleep_staging_isruc_fn
         >>> sleepstage_ds = isruc.set_task(sleep_staging_isruc_fn)
-        >>> sleepstage_ds.samples[0]
+        >>> sleepstage_ds[0]
         {
             'record_id': '1-0',
             'patient_id': '1',
@@ -138,7 +138,7 @@ def sleep_staging_sleepedf_fn(record, epoch_seconds=30):
         ...     )
         >>> from pyhealth.tasks import sleep_staging_sleepedf_fn
         >>> sleepstage_ds = sleepedf.set_task(sleep_staging_sleepedf_fn)
-        >>> sleepstage_ds.samples[0]
+        >>> sleepstage_ds[0]
         {
             'record_id': 'SC4001-0',
             'patient_id': 'SC4001',
@@ -247,7 +247,7 @@ def sleep_staging_shhs_fn(record, epoch_seconds=30):
         ...     )
         >>> from pyhealth.tasks import sleep_staging_shhs_fn
         >>> shhs_ds = shhs.set_task(sleep_staging_shhs_fn)
-        >>> shhs_ds.samples[0]
+        >>> shhs_ds[0]
         {
             'record_id': 'shhs1-200001-0', 
             'patient_id': 'shhs1-200001', 
@@ -340,7 +340,7 @@ if __name__ == "__main__":
     # )
 
     # sleep_staging_ds = dataset.set_task(sleep_staging_sleepedf_fn)
-    # print(sleep_staging_ds.samples[0])
+    # print(sleep_staging_ds[0])
     # # print(sleep_staging_ds.patient_to_index)
     # # print(sleep_staging_ds.record_to_index)
     # print(sleep_staging_ds.input_info)
@@ -354,7 +354,7 @@ if __name__ == "__main__":
     # )
 
     # sleep_staging_ds = dataset.set_task(sleep_staging_isruc_fn)
-    # print(sleep_staging_ds.samples[0])
+    # print(sleep_staging_ds[0])
     # # print(sleep_staging_ds.patient_to_index)
     # # print(sleep_staging_ds.record_to_index)
     # print(sleep_staging_ds.input_info)
@@ -365,7 +365,7 @@ if __name__ == "__main__":
         refresh_cache=True,
     )
     sleep_staging_ds = dataset.set_task(sleep_staging_shhs_fn)
-    print(sleep_staging_ds.samples[0])
+    print(sleep_staging_ds[0])
     # print(sleep_staging_ds.patient_to_index)
     # print(sleep_staging_ds.record_to_index)
     print(sleep_staging_ds.input_info)
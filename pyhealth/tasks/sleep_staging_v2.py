@@ -38,7 +38,7 @@ class SleepStagingSleepEDF(BaseTask):
             ...     )
             >>> from pyhealth.tasks import sleep_staging_sleepedf_fn
             >>> sleepstage_ds = sleepedf.set_task(sleep_staging_sleepedf_fn)
-            >>> sleepstage_ds.samples[0]
+            >>> sleepstage_ds[0]
             {
                 'record_id': 'SC4001-0',
                 'patient_id': 'SC4001',
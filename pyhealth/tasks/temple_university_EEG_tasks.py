@@ -29,7 +29,7 @@ def EEG_isAbnormal_fn(record):
         ...     )
         >>> from pyhealth.tasks import EEG_isabnormal_fn
         >>> EEG_abnormal_ds = isabnormal.set_task(EEG_isAbnormal_fn)
-        >>> EEG_abnormal_ds.samples[0]
+        >>> EEG_abnormal_ds[0]
         {
             'patient_id': 'aaaaamye',
             'visit_id': 's001',
@@ -178,7 +178,7 @@ def EEG_events_fn(record):
         ...     )
         >>> from pyhealth.tasks import EEG_events_fn
         >>> EEG_events_ds = EEGevents.set_task(EEG_events_fn)
-        >>> EEG_events_ds.samples[0]
+        >>> EEG_events_ds[0]
         {
             'patient_id': '0_00002265',
             'visit_id': '00000001',
@@ -350,7 +350,7 @@ if __name__ == "__main__":
     #     refresh_cache=True,
     # )
     # EEG_abnormal_ds = dataset.set_task(EEG_isAbnormal_fn)
-    # print(EEG_abnormal_ds.samples[0])
+    # print(EEG_abnormal_ds[0])
     # print(EEG_abnormal_ds.input_info)
     
     dataset = TUEVDataset(
@@ -359,7 +359,7 @@ if __name__ == "__main__":
         refresh_cache=True,
     )
     EEG_events_ds = dataset.set_task(EEG_events_fn)
-    print(EEG_events_ds.samples[0])
+    print(EEG_events_ds[0])
     print(EEG_events_ds.input_info)
     
     
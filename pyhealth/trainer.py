@@ -50,6 +50,62 @@ def get_metrics_fn(mode: str) -> Callable:
         raise ValueError(f"Mode {mode} is not supported")
 
 
+class CudaPrefetcher:
+    """Wraps a dataloader to copy the next batch to the GPU in the background.
+
+    The tensors of batch N+1 are copied on a dedicated CUDA stream while the
+    model computes on batch N, which hides the host to device copy. Batches
+    are yielded unchanged if the device is not a CUDA device or if they are
+    not dicts.
+
+    Args:
+        dataloader: Dataloader yielding dict batches.
+        device: Device to copy the tensors to.
+    """
+
+    def __init__(self, dataloader: DataLoader, device: str):
+        self.dataloader = dataloader
+        self.device = torch.device(device)
+
+    def __len__(self) -> int:
+        return len(self.dataloader)
+
+    def __iter__(self):
+        if self.device.type != "cuda":
+            yield from self.dataloader
+            return
+        stream = torch.cuda.Stream(device=self.device)
+        data_iterator = iter(self.dataloader)
+        next_batch = self._preload(data_iterator, stream)
+        while next_batch is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_stream(stream)
+            batch = next_batch
+            # tell the caching allocator the tensors are now used on the
+            # compute stream so their memory is not reused too early
+            if isinstance(batch, dict):
+                for value in batch.values():
+                    if isinstance(value, torch.Tensor):
+                        value.record_stream(current_stream)
+            next_batch = self._preload(data_iterator, stream)
+            yield batch
+
+    def _preload(self, data_iterator, stream: torch.cuda.Stream) -> Optional[Dict]:
+        try:
+            batch = next(data_iterator)
+        except StopIteration:
+            return None
+        if not isinstance(batch, dict):
+            return batch
+        with torch.cuda.stream(stream):
+            return {
+                key: value.to(self.device, non_blocking=True)
+                if isinstance(value, torch.Tensor)
+                else value
+                for key, value in batch.items()
+            }
+
+
 class Trainer:
     """Trainer for PyTorch models.
 
@@ -173,6 +229,9 @@ class Trainer:
         ]
         optimizer = optimizer_class(optimizer_grouped_parameters, **optimizer_params)
 
+        # overlap host to device copies with computation
+        train_dataloader = CudaPrefetcher(train_dataloader, self.device)
+
         # initialize
         data_iterator = iter(train_dataloader)
         best_score = -1 * float("inf") if monitor_criterion == "max" else float("inf")
@@ -272,7 +331,7 @@ class Trainer:
         patient_ids = []
         if additional_outputs is not None:
             additional_outputs = {k: [] for k in additional_outputs}
-        for data in tqdm(dataloader, desc="Evaluation"):
+        for data in tqdm(CudaPrefetcher(dataloader, self.device), desc="Evaluation"):
             self.model.eval()
             with torch.no_grad():
                 output = self.model(**data)
@@ -316,7 +375,7 @@ class Trainer:
             scores["loss"] = loss_mean
         else:
             loss_all = []
-            for data in tqdm(dataloader, desc="Evaluation"):
+            for data in tqdm(CudaPrefetcher(dataloader, self.device), desc="Evaluation"):
                 self.model.eval()
                 with torch.no_grad():
                     output = self.model(**data)
@@ -0,0 +1,544 @@
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest import mock
+
+import polars as pl
+
+from pyhealth.data import Patient
+from pyhealth.datasets import BaseDataset, base_dataset
+from pyhealth.tasks import BaseTask
+
+# A small synthetic MIMIC-III style extract. Column names are upper case as in
+# MIMIC-III, patient 3 has no admissions and patient 1 has two of them.
+PATIENTS_CSV = """SUBJECT_ID,GENDER,DOB
+1,F,2050-01-01 00:00:00
+2,M,2060-05-03 00:00:00
+3,F,2070-09-12 00:00:00
+"""
+
+ADMISSIONS_CSV = """SUBJECT_ID,HADM_ID,ADMITTIME,DISCHTIME,HOSPITAL_EXPIRE_FLAG
+1,10,2100-01-01 08:00:00,2100-01-05 12:00:00,0
+1,11,2100-03-01 09:30:00,2100-03-02 10:00:00,1
+2,20,2101-06-10 00:00:00,2101-06-12 00:00:00,0
+"""
+
+DIAGNOSES_ICD_CSV = """SUBJECT_ID,HADM_ID,SEQ_NUM,ICD9_CODE
+1,10,1,4019
+1,10,2,25000
+1,11,1,41401
+2,20,1,486
+"""
+
+CONFIG_YAML = """version: "1.4"
+tables:
+  patients:
+    file_path: "PATIENTS.csv"
+    patient_id: "subject_id"
+    timestamp: null
+    attributes:
+      - "gender"
+      - "dob"
+
+  admissions:
+    file_path: "ADMISSIONS.csv"
+    patient_id: "subject_id"
+    timestamp: "admittime"
+    dtypes:
+      admittime: "Datetime"
+      dischtime: "Datetime"
+    attributes:
+      - "hadm_id"
+      - "dischtime"
+      - "hospital_expire_flag"
+
+  diagnoses_icd:
+    file_path: "DIAGNOSES_ICD.csv"
+    patient_id: "subject_id"
+    join:
+      - file_path: "ADMISSIONS.csv"
+        "on": "hadm_id"
+        how: "inner"
+        columns:
+          - "dischtime"
+    timestamp: "dischtime"
+    attributes:
+      - "hadm_id"
+      - "icd9_code"
+      - "seq_num"
+"""
+
+TABLES = ["patients", "admissions", "diagnoses_icd"]
+
+
+def write_root(root, admissions_csv=ADMISSIONS_CSV):
+    """Writes the synthetic extract and its config to a directory."""
+    os.makedirs(root, exist_ok=True)
+    for file_name, content in [
+        ("PATIENTS.csv", PATIENTS_CSV),
+        ("ADMISSIONS.csv", admissions_csv),
+        ("DIAGNOSES_ICD.csv", DIAGNOSES_ICD_CSV),
+        ("config.yaml", CONFIG_YAML),
+    ]:
+        with open(os.path.join(root, file_name), "w") as f:
+            f.write(content)
+
+
+class AdmissionTask(BaseTask):
+    task_name = "admission"
+    input_schema = {"conditions": "sequence"}
+    output_schema = {"label": "binary"}
+
+    def __call__(self, patient):
+        samples = []
+        diagnoses = patient.get_events(event_type="diagnoses_icd")
+        for admission in patient.get_events(event_type="admissions"):
+            samples.append(
+                {
+                    "patient_id": patient.patient_id,
+                    "visit_id": admission.hadm_id,
+                    "conditions": [
+                        d.icd9_code for d in diagnoses if d.hadm_id == admission.hadm_id
+                    ],
+                    "label": int(admission.hospital_expire_flag),
+                }
+            )
+        return samples
+
+
+class VectorizedAdmissionTask(AdmissionTask):
+    task_name = "vectorized_admission"
+
+    def pre_filter(self, df):
+        raise AssertionError("pre_filter is not applied to vectorized tasks")
+
+    def __call__(self, patient):
+        raise AssertionError("vectorized tasks are not called per patient")
+
+    def vectorized_expr(self, df):
+        admissions = df.filter(pl.col("event_type") == "admissions").select(
+            pl.col("patient_id").cast(pl.String),
+            pl.col("admissions/hadm_id").alias("visit_id"),
+            pl.col("admissions/hospital_expire_flag").cast(pl.Int64).alias("label"),
+        )
+        diagnoses = (
+            df.filter(pl.col("event_type") == "diagnoses_icd")
+            .group_by(pl.col("diagnoses_icd/hadm_id").alias("visit_id"))
+            .agg(pl.col("diagnoses_icd/icd9_code").sort().alias("conditions"))
+        )
+        return admissions.join(diagnoses, on="visit_id", how="left").sort("visit_id")
+
+
+class RecentAdmissionTask(AdmissionTask):
+    task_name = "recent_admission"
+
+    def pre_filter(self, df):
+        return df.filter(pl.col("timestamp") >= datetime(2100, 3, 1))
+
+
+class OptionalKeyTask(AdmissionTask):
+    task_name = "optional_key"
+
+    def __call__(self, patient):
+        samples = super().__call__(patient)
+        for sample in samples:
+            if sample["label"]:
+                sample["expired"] = True
+        return samples
+
+
+class MissingLabelTask(AdmissionTask):
+    task_name = "missing_label"
+
+    def __call__(self, patient):
+        samples = super().__call__(patient)
+        for sample in samples:
+            if sample["visit_id"] == "20":
+                del sample["label"]
+        return samples
+
+
+class BaseDatasetTestCase(unittest.TestCase):
+    """Builds datasets from the synthetic extract in a private cache directory."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.root = os.path.join(self.tmp_dir, "root")
+        write_root(self.root)
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        os.makedirs(self.cache_dir)
+        patcher = mock.patch.object(
+            base_dataset, "MODULE_CACHE_PATH", self.cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_dataset(self, root=None, tables=TABLES):
+        root = root or self.root
+        return BaseDataset(
+            root=root,
+            tables=tables,
+            dataset_name="synthetic",
+            config_path=os.path.join(root, "config.yaml"),
+        )
+
+
+def count_events(dataset):
+    return dataset.global_event_df.select(pl.len()).collect().item()
+
+
+class TestParquetCache(BaseDatasetTestCase):
+    def parquet_files(self):
+        return os.listdir(os.path.join(self.cache_dir, "parquet"))
+
+    def test_shared_file_is_cached_once(self):
+        # ADMISSIONS.csv is both a table and a join of diagnoses_icd
+        self.make_dataset()
+        self.assertEqual(len(self.parquet_files()), 3)
+
+    def test_same_relative_root_in_other_directory(self):
+        other_dir = os.path.join(self.tmp_dir, "other")
+        write_root(
+            os.path.join(other_dir, "root"),
+            admissions_csv=ADMISSIONS_CSV.splitlines()[0] + "\n",
+        )
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.tmp_dir)
+        self.assertEqual(count_events(self.make_dataset(root="root")), 10)
+        os.chdir(other_dir)
+        self.assertEqual(count_events(self.make_dataset(root="root")), 3)
+
+    def test_replaced_file_with_older_mtime(self):
+        self.assertEqual(count_events(self.make_dataset()), 10)
+        admissions_path = os.path.join(self.root, "ADMISSIONS.csv")
+        with open(admissions_path, "w") as f:
+            f.write("\n".join(ADMISSIONS_CSV.splitlines()[:2]) + "\n")
+        os.utime(admissions_path, (0, 0))
+        self.assertEqual(count_events(self.make_dataset()), 6)
+        # The superseded conversion is removed
+        self.assertEqual(len(self.parquet_files()), 3)
+
+
+class TestEventCache(BaseDatasetTestCase):
+    def arrow_files(self):
+        return [f for f in os.listdir(self.cache_dir) if f.endswith(".arrow")]
+
+    def test_cache_is_reused(self):
+        dataset = self.make_dataset()
+        self.assertEqual(dataset.collected_global_event_df.height, 10)
+        other = self.make_dataset()
+        self.assertEqual(other.cache_path, dataset.cache_path)
+        self.assertEqual(other.collected_global_event_df.height, 10)
+
+    def test_changed_source_supersedes_cache(self):
+        dataset = self.make_dataset()
+        self.assertEqual(dataset.collected_global_event_df.height, 10)
+        with open(os.path.join(self.root, "DIAGNOSES_ICD.csv"), "a") as f:
+            f.write("2,20,2,5849\n")
+        changed = self.make_dataset()
+        self.assertNotEqual(changed.cache_path, dataset.cache_path)
+        self.assertEqual(changed.collected_global_event_df.height, 11)
+        self.assertEqual(self.arrow_files(), [os.path.basename(changed.cache_path)])
+
+    def test_other_tables_are_kept(self):
+        self.make_dataset().collected_global_event_df
+        self.make_dataset(tables=["patients"]).collected_global_event_df
+        self.assertEqual(len(self.arrow_files()), 2)
+
+
+    def test_unique_patient_ids_without_cache(self):
+        dataset = self.make_dataset()
+        self.assertEqual(sorted(dataset.unique_patient_ids), ["1", "2", "3"])
+        self.assertEqual(self.arrow_files(), [])
+
+    def test_unique_patient_ids_from_cache(self):
+        self.make_dataset().collected_global_event_df
+        dataset = self.make_dataset()
+        with mock.patch.object(
+            pl.LazyFrame, "collect", side_effect=AssertionError("rescanned")
+        ):
+            self.assertEqual(sorted(dataset.unique_patient_ids), ["1", "2", "3"])
+
+
+    def test_stats(self):
+        def stats(dataset):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                dataset.stats()
+            return out.getvalue().splitlines()[1:]
+
+        expected = ["Number of patients: 3", "Number of events: 10"]
+        self.assertEqual(stats(self.make_dataset()), expected)
+        self.assertEqual(self.arrow_files(), [])
+        self.make_dataset().collected_global_event_df
+        with mock.patch.object(
+            pl.LazyFrame, "collect", side_effect=AssertionError("rescanned")
+        ):
+            self.assertEqual(stats(self.make_dataset()), expected)
+
+
+class TestPatientEvents(BaseDatasetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patient = self.make_dataset().get_patient("1")
+
+    def test_filter_by_event_type(self):
+        counts = {"patients": 1, "admissions": 2, "diagnoses_icd": 3}
+        for event_type, count in counts.items():
+            events = self.patient.get_events(event_type=event_type)
+            self.assertEqual(len(events), count)
+            self.assertTrue(all(e.event_type == event_type for e in events))
+            df = self.patient.get_events(event_type=event_type, return_df=True)
+            self.assertEqual(df["event_type"].to_list(), [event_type] * count)
+
+    def test_filter_by_time(self):
+        # Both bounds are inclusive and events without a timestamp are dropped
+        start, end = datetime(2100, 1, 5, 12), datetime(2100, 3, 1, 9, 30)
+        events = self.patient.get_events(start=start, end=end)
+        self.assertEqual(
+            [(e.event_type, e.timestamp) for e in events],
+            [
+                ("diagnoses_icd", start),
+                ("diagnoses_icd", start),
+                ("admissions", end),
+            ],
+        )
+        df = self.patient.get_events(start=start, end=end, return_df=True)
+        self.assertEqual(df["timestamp"].to_list(), [start, start, end])
+        self.assertEqual(len(self.patient.get_events(start=datetime(2100, 3, 2))), 1)
+        self.assertEqual(len(self.patient.get_events(end=datetime(2100, 1, 1))), 0)
+
+    def test_filter_by_event_type_and_time(self):
+        kwargs = dict(event_type="admissions", start=datetime(2100, 1, 2))
+        events = self.patient.get_events(**kwargs)
+        self.assertEqual([e.hadm_id for e in events], ["11"])
+        df = self.patient.get_events(return_df=True, **kwargs)
+        self.assertEqual(df["admissions/hadm_id"].to_list(), ["11"])
+
+    def test_return_df_columns(self):
+        df = self.patient.get_events(event_type="admissions", return_df=True)
+        self.assertEqual(df.columns[:3], ["patient_id", "event_type", "timestamp"])
+        self.assertEqual(
+            set(df.columns[3:]),
+            {
+                "patients/gender",
+                "patients/dob",
+                "admissions/hadm_id",
+                "admissions/dischtime",
+                "admissions/hospital_expire_flag",
+                "diagnoses_icd/hadm_id",
+                "diagnoses_icd/icd9_code",
+                "diagnoses_icd/seq_num",
+            },
+        )
+        self.assertEqual(df.schema["timestamp"], pl.Datetime("us"))
+        self.assertEqual(df["patient_id"].cast(pl.String).to_list(), ["1", "1"])
+
+    def test_timestamp_round_trip(self):
+        admittimes = [datetime(2100, 1, 1, 8), datetime(2100, 3, 1, 9, 30)]
+        events = self.patient.get_events(event_type="admissions")
+        self.assertEqual([e.timestamp for e in events], admittimes)
+        df = self.patient.get_events(event_type="admissions", return_df=True)
+        self.assertEqual(df["timestamp"].to_list(), admittimes)
+        self.assertIsNone(self.patient.get_events(event_type="patients")[0].timestamp)
+
+    def test_patient_from_data_frame(self):
+        df = self.patient.get_events(return_df=True).reverse()
+        patient = Patient("1", df)
+        self.assertEqual(
+            [e.timestamp for e in patient.get_events()],
+            [e.timestamp for e in self.patient.get_events()],
+        )
+        self.assertEqual(
+            patient.get_events(event_type="admissions"),
+            self.patient.get_events(event_type="admissions"),
+        )
+        self.assertEqual(
+            patient.get_events(start=datetime(2100, 3, 2), return_df=True).height, 1
+        )
+
+    def test_unknown_event_type(self):
+        self.assertEqual(self.patient.get_events(event_type="noteevents"), [])
+        df = self.patient.get_events(event_type="noteevents", return_df=True)
+        self.assertEqual(df.height, 0)
+
+    def test_unknown_event_type_from_data_frame(self):
+        patient = Patient("1", self.patient.get_events(return_df=True))
+        self.assertEqual(patient.get_events(event_type="noteevents"), [])
+        df = patient.get_events(event_type="noteevents", return_df=True)
+        self.assertEqual(df.height, 0)
+
+    def test_typed_attributes(self):
+        admission = self.patient.get_events(event_type="admissions")[0]
+        self.assertEqual(admission.dischtime, datetime(2100, 1, 5, 12))
+        self.assertEqual(admission.hadm_id, "10")
+        df = self.patient.get_events(event_type="admissions", return_df=True)
+        self.assertEqual(df.schema["admissions/dischtime"], pl.Datetime("us"))
+        self.assertEqual(df["admissions/dischtime"][0], datetime(2100, 1, 5, 12))
+
+    def test_attributes_of_other_types_are_skipped(self):
+        diagnosis = self.patient.get_events(event_type="diagnoses_icd")[0]
+        self.assertEqual(set(diagnosis.attr_dict), {"hadm_id", "icd9_code", "seq_num"})
+
+
+class TestIterPatients(BaseDatasetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dataset = self.make_dataset()
+
+    def test_events_are_sorted_by_timestamp(self):
+        for patient in self.dataset.iter_patients():
+            timestamps = patient.get_events(return_df=True)["timestamp"]
+            self.assertTrue(timestamps.drop_nulls().is_sorted())
+        self.assertEqual(
+            [e.timestamp for e in self.dataset.get_patient("1").get_events()],
+            [
+                None,
+                datetime(2100, 1, 1, 8),
+                datetime(2100, 1, 5, 12),
+                datetime(2100, 1, 5, 12),
+                datetime(2100, 3, 1, 9, 30),
+                datetime(2100, 3, 2, 10),
+            ],
+        )
+
+    def test_patients_share_the_event_table(self):
+        patients = list(self.dataset.iter_patients())
+        self.assertEqual(sorted(p.patient_id for p in patients), ["1", "2", "3"])
+        self.assertEqual(
+            sum(p.data_source.num_rows for p in patients),
+            self.dataset.event_table.num_rows,
+        )
+        buffer = self.dataset.event_table["timestamp"].chunks[0].buffers()[1]
+        patient = self.dataset.get_patient("2")
+        sliced = patient.data_source["timestamp"].chunks[0].buffers()[1]
+        self.assertEqual(sliced.address, buffer.address)
+
+    def test_pickled_patient(self):
+        patient = self.dataset.get_patient("1")
+        restored = pickle.loads(pickle.dumps(patient))
+        self.assertEqual(restored.patient_id, "1")
+        self.assertEqual(restored.get_events(), patient.get_events())
+
+    def test_get_patient(self):
+        with mock.patch.object(
+            pl.LazyFrame, "collect", side_effect=AssertionError("rescanned")
+        ):
+            patient = self.dataset.get_patient("2")
+        self.assertEqual(len(patient.get_events()), 3)
+        with self.assertRaisesRegex(AssertionError, "Patient 4 not found"):
+            self.dataset.get_patient("4")
+
+    def test_filtered_events(self):
+        df = self.dataset.collected_global_event_df.filter(
+            pl.col("event_type") == "admissions"
+        )
+        patients = {p.patient_id: p for p in self.dataset.iter_patients(df)}
+        self.assertEqual(sorted(patients), ["1", "2"])
+        self.assertEqual(len(patients["1"].get_events()), 2)
+
+    def test_unsorted_events(self):
+        df = self.dataset.collected_global_event_df.reverse()
+        patients = {p.patient_id: p for p in self.dataset.iter_patients(df)}
+        self.assertEqual(sorted(patients), ["1", "2", "3"])
+        events = patients["1"].get_events()
+        expected = self.dataset.get_patient("1").get_events()
+        # Events with equal timestamps may be in any order
+        self.assertEqual(
+            [e.timestamp for e in events], [e.timestamp for e in expected]
+        )
+        self.assertCountEqual(map(repr, events), map(repr, expected))
+
+
+class TestSetTask(BaseDatasetTestCase):
+    def test_samples(self):
+        sample_dataset = self.make_dataset().set_task(AdmissionTask())
+        self.assertEqual(len(sample_dataset), 3)
+        visits = sorted(s["visit_id"] for s in sample_dataset.samples)
+        self.assertEqual(visits, ["10", "11", "20"])
+
+    def test_no_workers_is_serial(self):
+        dataset = self.make_dataset()
+        serial = dataset.set_task(AdmissionTask(), num_workers=1)
+        no_workers = dataset.set_task(AdmissionTask(), num_workers=0)
+        self.assertEqual(
+            [s["visit_id"] for s in no_workers.samples],
+            [s["visit_id"] for s in serial.samples],
+        )
+
+    def test_process_pool(self):
+        dataset = self.make_dataset()
+        for task in [AdmissionTask(), RecentAdmissionTask()]:
+            serial = dataset.set_task(task, num_workers=1)
+            parallel = dataset.set_task(task, num_workers=2)
+            self.assertEqual(len(parallel), len(serial))
+            for a, b in zip(parallel.samples, serial.samples):
+                self.assertEqual(a["patient_id"], b["patient_id"])
+                self.assertEqual(a["visit_id"], b["visit_id"])
+                self.assertEqual(a["conditions"].tolist(), b["conditions"].tolist())
+                self.assertEqual(a["label"].item(), b["label"].item())
+
+    def test_cached_events_are_not_rescanned(self):
+        self.make_dataset().set_task(AdmissionTask())
+        dataset = self.make_dataset()
+        with mock.patch.object(
+            pl.LazyFrame, "collect", side_effect=AssertionError("rescanned")
+        ):
+            sample_dataset = dataset.set_task(AdmissionTask())
+        self.assertEqual(len(sample_dataset), 3)
+
+    def test_pre_filter_on_timestamp(self):
+        dataset = self.make_dataset()
+        self.assertEqual(
+            dataset.collected_global_event_df.schema["timestamp"], pl.Datetime("us")
+        )
+        sample_dataset = dataset.set_task(RecentAdmissionTask())
+        visits = sorted(s["visit_id"] for s in sample_dataset.samples)
+        self.assertEqual(visits, ["11", "20"])
+
+    def test_vectorized_task(self):
+        dataset = self.make_dataset()
+        vectorized = dataset.set_task(VectorizedAdmissionTask())
+        per_patient = dataset.set_task(AdmissionTask())
+
+        def summary(sample_dataset):
+            vocab = {
+                index: code
+                for code, index in sample_dataset.input_processors[
+                    "conditions"
+                ].code_vocab.items()
+            }
+            return sorted(
+                (
+                    s["patient_id"],
+                    s["visit_id"],
+                    sorted(vocab[int(i)] for i in s["conditions"]),
+                    s["label"].item(),
+                )
+                for s in sample_dataset.samples
+            )
+
+        self.assertEqual(summary(vectorized), summary(per_patient))
+        self.assertEqual(
+            summary(vectorized)[0], ("1", "10", ["25000", "4019"], 0.0)
+        )
+
+    def test_heterogeneous_keys(self):
+        sample_dataset = self.make_dataset().set_task(OptionalKeyTask())
+        expired = {s["visit_id"]: s["expired"] for s in sample_dataset.samples}
+        self.assertEqual(expired, {"10": None, "11": True, "20": None})
+
+    def test_missing_schema_key(self):
+        with self.assertRaisesRegex(AssertionError, "label"):
+            self.make_dataset().set_task(MissingLabelTask())
+
+
+if __name__ == "__main__":
+    unittest.main()
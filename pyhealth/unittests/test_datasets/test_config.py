@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from pyhealth.datasets.configs import config, load_yaml_config
+
+CONFIG_YAML = """version: "1.4"
+tables:
+  patients:
+    file_path: "PATIENTS.csv"
+    patient_id: "subject_id"
+    timestamp: null
+    attributes:
+      - "gender"
+
+  admissions:
+    file_path: "ADMISSIONS.csv"
+    patient_id: "subject_id"
+    timestamp: "admittime"
+    dtypes:
+      admittime: "Datetime"
+    attributes:
+      - "hadm_id"
+      - "dischtime"
+"""
+
+
+class TestLoadYamlConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, "config.yaml")
+        self.write(CONFIG_YAML, mtime=1000)
+
+    def write(self, content, mtime):
+        with open(self.path, "w") as f:
+            f.write(content)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_parsed_once(self):
+        with mock.patch.object(
+            config.yaml, "safe_load", wraps=config.yaml.safe_load
+        ) as safe_load:
+            first = load_yaml_config(self.path)
+            second = load_yaml_config(self.path)
+        self.assertEqual(safe_load.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_relative_path_shares_cache(self):
+        load_yaml_config(self.path)
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.tmp_dir)
+        with mock.patch.object(config.yaml, "safe_load") as safe_load:
+            load_yaml_config("config.yaml")
+        safe_load.assert_not_called()
+
+    def test_changed_mtime_invalidates(self):
+        self.assertEqual(load_yaml_config(self.path).version, "1.4")
+        self.write(CONFIG_YAML.replace('"1.4"', '"1.5"'), mtime=2000)
+        self.assertEqual(load_yaml_config(self.path).version, "1.5")
+
+    def test_mutations_do_not_leak(self):
+        first = load_yaml_config(self.path)
+        first.tables["admissions"].attributes.append("deathtime")
+        first.tables["admissions"].dtypes["hadm_id"] = "Int64"
+        del first.tables["patients"]
+        second = load_yaml_config(self.path)
+        self.assertIn("patients", second.tables)
+        self.assertEqual(
+            second.tables["admissions"].attributes,
+            ["hadm_id", "dischtime"],
+        )
+        self.assertNotIn("hadm_id", second.tables["admissions"].dtypes)
+
+
+if __name__ == "__main__":
+    unittest.main()
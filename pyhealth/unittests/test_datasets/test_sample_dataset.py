@@ -0,0 +1,70 @@
+import unittest
+
+import torch
+
+from pyhealth.datasets import SampleDataset
+
+INPUT_SCHEMA = {"conditions": "sequence"}
+OUTPUT_SCHEMA = {"label": "binary"}
+
+
+class TestSampleDataset(unittest.TestCase):
+    def setUp(self):
+        self.samples = [
+            {"patient_id": "1", "conditions": ["4019", "25000"], "label": 0},
+            {"patient_id": "1", "conditions": ["41401"], "label": 1},
+            {"patient_id": "2", "conditions": ["486", "4019"], "label": 0},
+        ]
+
+    def test_from_list(self):
+        dataset = SampleDataset(self.samples, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(dataset[2]["patient_id"], "2")
+        self.assertIsInstance(dataset[0]["conditions"], torch.Tensor)
+        self.assertEqual(dataset[0]["conditions"].shape, (2,))
+        self.assertEqual(dataset.samples[1]["label"].item(), 1.0)
+
+    def test_from_dict_matches_list(self):
+        columns = {k: [s[k] for s in self.samples] for k in self.samples[0]}
+        from_dict = SampleDataset(columns, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        from_list = SampleDataset(self.samples, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        self.assertEqual(len(from_dict), len(from_list))
+        for a, b in zip(from_dict.samples, from_list.samples):
+            self.assertEqual(a.keys(), b.keys())
+            self.assertEqual(a["patient_id"], b["patient_id"])
+            self.assertTrue(torch.equal(a["conditions"], b["conditions"]))
+            self.assertTrue(torch.equal(a["label"], b["label"]))
+
+    def test_from_dict_keeps_caller_columns(self):
+        columns = {k: [s[k] for s in self.samples] for k in self.samples[0]}
+        SampleDataset(columns, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        self.assertEqual(columns["conditions"][0], ["4019", "25000"])
+        self.assertEqual(columns["label"], [0, 1, 0])
+
+    def test_samples_are_copies(self):
+        dataset = SampleDataset(self.samples, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        dataset.samples[0]["patient_id"] = "3"
+        self.assertEqual(dataset[0]["patient_id"], "1")
+
+    def test_heterogeneous_keys(self):
+        self.samples[1]["extra"] = "x"
+        dataset = SampleDataset(self.samples, INPUT_SCHEMA, OUTPUT_SCHEMA)
+        self.assertEqual([s["extra"] for s in dataset.samples], [None, "x", None])
+
+    def test_missing_schema_key(self):
+        del self.samples[1]["label"]
+        with self.assertRaises(AssertionError):
+            SampleDataset(self.samples, INPUT_SCHEMA, OUTPUT_SCHEMA)
+
+    def test_unaligned_columns(self):
+        columns = {"conditions": [["4019"], ["486"]], "label": [0]}
+        with self.assertRaises(AssertionError):
+            SampleDataset(columns, INPUT_SCHEMA, OUTPUT_SCHEMA)
+
+    def test_empty(self):
+        dataset = SampleDataset([], INPUT_SCHEMA, OUTPUT_SCHEMA)
+        self.assertEqual(len(dataset), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import torch
+from torch.utils.data import DataLoader
+
+from pyhealth.trainer import CudaPrefetcher
+
+SAMPLES = [
+    {"patient_id": str(i), "x": torch.full((3,), float(i))} for i in range(5)
+]
+
+
+class TestCudaPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.dataloader = DataLoader(SAMPLES, batch_size=2)
+
+    def assertBatchesEqual(self, batches, expected, device):
+        self.assertEqual(len(batches), len(expected))
+        for batch, expected_batch in zip(batches, expected):
+            self.assertEqual(batch.keys(), expected_batch.keys())
+            self.assertEqual(batch["patient_id"], expected_batch["patient_id"])
+            self.assertEqual(batch["x"].device.type, device)
+            self.assertTrue(torch.equal(batch["x"].cpu(), expected_batch["x"]))
+
+    def test_len(self):
+        self.assertEqual(len(CudaPrefetcher(self.dataloader, "cpu")), 3)
+        self.assertEqual(len(CudaPrefetcher(self.dataloader, "cuda")), 3)
+
+    def test_cpu_passthrough(self):
+        batches = list(CudaPrefetcher(self.dataloader, "cpu"))
+        self.assertBatchesEqual(batches, list(self.dataloader), "cpu")
+
+    def test_non_dict_batches_on_cpu(self):
+        batches = [(torch.zeros(2), "a"), [torch.ones(2)]]
+        self.assertEqual(list(CudaPrefetcher(batches, "cpu")), batches)
+
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is not available")
+    def test_cuda_stream(self):
+        batches = list(CudaPrefetcher(self.dataloader, "cuda"))
+        self.assertBatchesEqual(batches, list(self.dataloader), "cuda")
+
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is not available")
+    def test_non_dict_batches_on_cuda(self):
+        batches = [(torch.zeros(2), "a"), [torch.ones(2)]]
+        self.assertEqual(list(CudaPrefetcher(batches, "cuda")), batches)
+
+
+if __name__ == "__main__":
+    unittest.main()
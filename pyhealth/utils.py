@@ -19,6 +19,33 @@ def set_seed(seed):
     os.environ["PYTHONHASHSEED"] = str(seed)
 
 
+def recommend_loader_kwargs(dataset_len):
+    """Recommends DataLoader worker settings for the current machine.
+
+    Workers are capped at 4 and leave one usable CPU for the main process, since
+    more collate processes mostly add contention. Pinned memory is only used
+    when a GPU is available, and prefetching is capped at 2 batches per worker
+    to bound the pinned host memory held in flight.
+
+    Args:
+        dataset_len: number of samples in the dataset to be loaded.
+
+    Returns:
+        A dict of DataLoader keyword arguments. The worker-only keys are
+            omitted when no workers are recommended.
+    """
+    try:
+        num_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS and Windows
+        num_cpus = os.cpu_count() or 1
+    num_workers = max(0, min(4, num_cpus - 1, dataset_len))
+    kwargs = {"num_workers": num_workers, "pin_memory": torch.cuda.is_available()}
+    if num_workers > 0:
+        kwargs.update(prefetch_factor=2, persistent_workers=True)
+    return kwargs
+
+
 def create_directory(directory):
     if not os.path.exists(directory):
         os.makedirs(directory)